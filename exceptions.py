@@ -1,39 +1,66 @@
-class HTTPException(Exception):
+class BotError(Exception):
+    """Базовая ошибка бота.
+    Атрибут code — короткий код ошибки для логов и обработки в main.
+    """
+    code = 'BOT_ERROR'
+
+
+class RecoverableError(BotError):
+    """Временная ошибка. Запрос к API можно повторить."""
+    code = 'RECOVERABLE'
+
+
+class UnrecoverableError(BotError):
+    """Ошибка, которую не исправить повторным запросом к API."""
+    code = 'UNRECOVERABLE'
+
+
+class HTTPException(RecoverableError):
     """Ошибка при запросе к API. Страница недоступна."""
-    pass
+    code = 'HTTP_ERROR'
+
+
+class RequestAPIException(RecoverableError):
+    """Не удалось выполнить запрос к API."""
+    code = 'REQUEST_ERROR'
+
+
+class APIAccessException(UnrecoverableError):
+    """API отклонил запрос. Проверьте токен и параметры запроса."""
+    code = 'ACCESS_DENIED'
 
 
-class EmptyResponseException(ValueError):
-    """Ответ API пришел в виде пустого списка."""
-    pass
+class APIPausedException(BotError):
+    """API долго недоступен, запросы к нему временно приостановлены."""
+    code = 'API_PAUSED'
 
 
-class NotDictException(TypeError):
+class NotDictException(BotError, TypeError):
     """Ответ API пришел не в виде словаря."""
-    pass
+    code = 'NOT_DICT'
 
 
-class NotListException(TypeError):
+class NotListException(BotError, TypeError):
     """Ответ API пришел не в виде списка."""
-    pass
+    code = 'NOT_LIST'
 
 
-class StatusNotExistException(KeyError):
+class StatusNotExistException(BotError, KeyError):
     """Отсутствует ключ status в ответе API."""
-    pass
+    code = 'NO_STATUS'
 
 
-class HWStatusNotExistException(KeyError):
+class HWStatusNotExistException(BotError, KeyError):
     """Неизвестный статус домашней работы.
     Такой ключ status не существует в словаре HOMEWORK_VERDICTS."""
-    pass
+    code = 'UNKNOWN_STATUS'
 
 
-class HWNameNotExistException(KeyError):
+class HWNameNotExistException(BotError, KeyError):
     """Отсутствует ключ homework_name в ответе API."""
-    pass
+    code = 'NO_HOMEWORK_NAME'
 
 
-class HWNotExistException(KeyError):
+class HWNotExistException(BotError, KeyError):
     """Отсутствует ключ homeworks в ответе API."""
-    pass
+    code = 'NO_HOMEWORKS'
@@ -1,16 +1,19 @@
 import logging
 import os
+import random
 import time
 import requests
 import sys
 import exceptions
-import telegram
 
-from telegram import Bot, TelegramError
 from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Callable
 
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from telegram import Bot
+
 load_dotenv()
 
 PRACTICUM_TOKEN = os.getenv('PRACTICUM_TOKEN')
@@ -19,7 +22,15 @@ TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_PERIOD = 600
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
+REQUEST_TIMEOUT = (5, 25)
+BREAKER_THRESHOLD = 5
+BREAKER_MAX_PAUSE = 3600
+API_PAUSED_MESSAGE = 'API недоступен, запросы временно приостановлены'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+CACHE_VALIDATORS = (
+    ('ETag', 'If-None-Match'),
+    ('Last-Modified', 'If-Modified-Since'),
+)
 
 
 HOMEWORK_VERDICTS = {
@@ -31,42 +42,140 @@ HOMEWORK_VERDICTS = {
 
 logger = logging.getLogger(__name__)
 
+_conditional_headers = {}
+_received_validators = {}
+
 
-def send_message(bot: Bot, message: str) -> None:
+def send_message(bot: 'Bot', message: str) -> None:
     """Отправляет сообщение в Telegram чат.
     Принимает на вход экземпляр класса Bot и строку с текстом сообщения.
+    Если Telegram просит подождать (429), повторяет отправку один раз.
     """
+    from telegram.error import RetryAfter, TelegramError
+
     logger.info('Формирование сообщения')
-    try:
-        bot.send_message(TELEGRAM_CHAT_ID, message)
-        logger.debug('Сообщение успешно отправлено')
-    except TelegramError as error:
-        logger.error(f'Сбой при отправке сообщения в телеграм: {error}')
+    for attempt in range(2):
+        try:
+            bot.send_message(TELEGRAM_CHAT_ID, message)
+        except RetryAfter as error:
+            if attempt:
+                logger.error(
+                    'Сбой при отправке сообщения в телеграм: %s', error
+                )
+                return
+            logger.warning(
+                'Превышен лимит сообщений Telegram. Повтор через %s с',
+                error.retry_after
+            )
+            time.sleep(error.retry_after)
+        except TelegramError as error:
+            logger.error('Сбой при отправке сообщения в телеграм: %s', error)
+            return
+        else:
+            logger.debug('Сообщение успешно отправлено')
+            return
 
 
 def get_api_answer(current_timestamp: int) -> dict:
     """Делает запрос к единственному эндпоинту API-сервиса.
     В качестве параметра функция получает временную метку.
+    Если API ответил, что данные не изменились (304),
+    возвращает ответ без новых домашних работ.
     """
     logger.info('Выполнение запроса к API')
     timestamp = current_timestamp or int(time.time())
-    request_params = dict(
-        url=ENDPOINT,
-        headers=HEADERS,
-        params={'from_date': timestamp}
-    )
     try:
-        response = requests.get(**request_params)
-        if response.status_code != HTTPStatus.OK:
-            raise exceptions.HTTPException(
-                f'Страница недоступна. Ошибка: {response.status_code}'
+        response = requests.get(
+            url=ENDPOINT,
+            headers={**HEADERS, **_conditional_headers.get(timestamp, {})},
+            params={'from_date': timestamp},
+            timeout=REQUEST_TIMEOUT
+        )
+    except requests.Timeout as error:
+        raise exceptions.RequestAPIException(
+            f'Превышено время ожидания ответа API: {error}'
+        ) from error
+    except requests.RequestException as error:
+        raise exceptions.RequestAPIException(
+            f'Ошибка запроса: {error}'
+        ) from error
+    if response.status_code == HTTPStatus.NOT_MODIFIED:
+        logger.debug('Ответ API не изменился с прошлого запроса')
+        _received_validators.clear()
+        return {'homeworks': [], 'current_date': timestamp}
+    if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+        raise exceptions.HTTPException(
+            f'Страница недоступна. Ошибка: {response.status_code}'
+        )
+    if response.status_code != HTTPStatus.OK:
+        raise exceptions.APIAccessException(
+            f'API отклонил запрос. Ошибка: {response.status_code}'
+        )
+    _received_validators.clear()
+    _received_validators[timestamp] = {
+        request_header: response.headers[response_header]
+        for response_header, request_header in CACHE_VALIDATORS
+        if response.headers.get(response_header)
+    }
+    return response.json()
+
+
+def _save_validators() -> None:
+    """Запоминает валидаторы последнего ответа API.
+    Вызывается только после того, как ответ успешно обработан,
+    иначе следующий запрос получил бы 304 и необработанное
+    обновление потерялось бы. Валидаторы привязаны к from_date
+    и не отправляются с запросом за другую временную метку.
+    """
+    if _received_validators:
+        _conditional_headers.clear()
+        _conditional_headers.update(_received_validators)
+        _received_validators.clear()
+
+
+def _retry(
+    func: Callable[..., Any],
+    *args: Any,
+    max_attempts: int = 5,
+    base: float = 1.0,
+    cap: float = RETRY_PERIOD
+) -> Any:
+    """Вызывает функцию, повторяя вызов при временных ошибках.
+    Пауза между попытками растет экспоненциально со случайным
+    разбросом и не превышает cap секунд. Неисправимые ошибки
+    пробрасываются сразу.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return func(*args)
+        except exceptions.RecoverableError as error:
+            if attempt == max_attempts - 1:
+                raise
+            delay = random.uniform(0, min(cap, base * 2 ** attempt))
+            logger.warning(
+                'Попытка %s не удалась: %s. Повтор через %.1f с',
+                attempt + 1, error, delay
             )
-        return response.json()
-    except requests.RequestException:
-        logger.error('Ошибка запроса')
+            time.sleep(delay)
 
 
-def check_response(response: dict) -> dict:
+def _breaker_pause(failures: int) -> int:
+    """Считает, на сколько секунд приостановить запросы к API.
+    Пока число неудач подряд меньше BREAKER_THRESHOLD, запросы
+    не приостанавливаются. Дальше пауза удваивается с каждой
+    неудачей, но не превышает BREAKER_MAX_PAUSE. Пауза всегда
+    длиннее обычного RETRY_PERIOD, иначе следующий опрос
+    состоялся бы по расписанию.
+    """
+    if failures < BREAKER_THRESHOLD:
+        return 0
+    return min(
+        BREAKER_MAX_PAUSE,
+        RETRY_PERIOD * 2 ** (failures - BREAKER_THRESHOLD + 1)
+    )
+
+
+def check_response(response: dict) -> list:
     """Проверяет ответ API на корректность.
     В качестве параметра функция получает ответ API.
     Ответ приведен к типам данных Python.
@@ -80,16 +189,12 @@ def check_response(response: dict) -> dict:
         raise exceptions.HWNotExistException(
             'Домашняя работа отсутствует'
         )
-    if not isinstance(response['homeworks'], list):
-        response_content = response['homeworks']
+    homeworks = response['homeworks']
+    if not isinstance(homeworks, list):
         raise exceptions.NotListException(
-            f'Пришел ответ в неверном формате: {type(response_content)}'
-        )
-    if response['homeworks'] is None:
-        raise exceptions.EmptyResponseException(
-            'Список домашних работ не содержит элементов'
+            f'Пришел ответ в неверном формате: {type(homeworks)}'
         )
-    return response['homeworks']
+    return homeworks
 
 
 def parse_status(homework: dict) -> str:
@@ -98,21 +203,21 @@ def parse_status(homework: dict) -> str:
     списка домашних работ.
     """
     logger.info('Извлечение статуса домашней работы')
-    if 'homework_name' not in homework:
+    homework_name = homework.get('homework_name')
+    if homework_name is None:
         raise exceptions.HWNameNotExistException(
             'Отсутствует имя домашней работы'
         )
-    if 'status' not in homework:
+    homework_status = homework.get('status')
+    if homework_status is None:
         raise exceptions.StatusNotExistException(
             'Отсутствует статус домашней работы'
         )
-    homework_name = homework['homework_name']
-    homework_status = homework['status']
-    if homework_status not in HOMEWORK_VERDICTS:
+    verdict = HOMEWORK_VERDICTS.get(homework_status)
+    if verdict is None:
         raise exceptions.HWStatusNotExistException(
             f'Неизвестный статус домашней работы: {homework_status}'
         )
-    verdict = HOMEWORK_VERDICTS[homework_status]
     return f'Изменился статус проверки работы "{homework_name}". {verdict}'
 
 
@@ -122,46 +227,60 @@ def check_tokens() -> bool:
     функция должна вернуть False, иначе — True.
     """
     logger.info('Проверка доступности переменных окружения')
-    if all((PRACTICUM_TOKEN, TELEGRAM_CHAT_ID, TELEGRAM_TOKEN)):
+    tokens = {
+        'PRACTICUM_TOKEN': PRACTICUM_TOKEN,
+        'TELEGRAM_TOKEN': TELEGRAM_TOKEN,
+        'TELEGRAM_CHAT_ID': TELEGRAM_CHAT_ID,
+    }
+    non_existent_tokens = [name for name, value in tokens.items() if not value]
+    if not non_existent_tokens:
         return True
-    else:
-        logger.critical('Это логирование нужно для тестов')
-        tokens = (
-            PRACTICUM_TOKEN,
-            TELEGRAM_CHAT_ID,
-            TELEGRAM_TOKEN
-        )
-        non_existent_tokens = ()
-        for token in tokens:
-            if token is None:
-                non_existent_tokens.add(token)
-        logger.critical(f'Отсутствуют токены: {non_existent_tokens}')
+    logger.critical(
+        'Отсутствуют токены: %s', ', '.join(non_existent_tokens)
+    )
+    return False
 
 
 def main() -> None:
     """Основная логика работы бота."""
+    import telegram
+
     logger.info('Запуск бота')
     bot = telegram.Bot(token=TELEGRAM_TOKEN)
     if not check_tokens():
         sys.exit('Отсутствует один или несколько токенов')
     current_timestamp = int(time.time())
     previous_message = ''
+    failures = 0
+    api_paused_until = 0.0
 
     while True:
         try:
-            response = get_api_answer(current_timestamp)
+            if time.monotonic() < api_paused_until:
+                raise exceptions.APIPausedException(API_PAUSED_MESSAGE)
+            response = _retry(get_api_answer, current_timestamp)
+            failures = 0
             homeworks = check_response(response)
-            if len(homeworks) > 0:
-                homework = homeworks[0]
-                message = parse_status(homework)
+            if homeworks:
+                message = parse_status(homeworks[0])
                 current_timestamp = response.get(
                     'current_date', current_timestamp
                 )
             else:
                 logger.debug('Статус работы не поменялся')
                 message = 'Нет новых статусов'
+            _save_validators()
+        except exceptions.BotError as error:
+            logger.error('Сбой в работе программы [%s]: %s', error.code, error)
+            message = f'Сбой в работе программы: {error}'
+            if isinstance(error, exceptions.RecoverableError):
+                failures += 1
+                pause = _breaker_pause(failures)
+                api_paused_until = time.monotonic() + pause
+                if pause:
+                    message = f'Сбой в работе программы: {API_PAUSED_MESSAGE}'
         except Exception as error:
-            logger.error(f'Сбой в работе программы: {error}')
+            logger.exception('Непредвиденный сбой в работе бота: %s', error)
             message = f'Сбой в работе программы: {error}'
         finally:
             if message != previous_message:
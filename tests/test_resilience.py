@@ -0,0 +1,357 @@
+import logging
+from http import HTTPStatus
+
+import pytest
+import requests
+import telegram
+
+import exceptions
+import utils
+
+
+def mock_responses_get(monkeypatch, outcomes, random_timestamp):
+    """Patch requests.get to play the outcomes one by one.
+    An outcome is either an HTTP status or an exception to raise.
+    Returns the list with kwargs of every request made.
+    """
+    calls = []
+    outcomes = list(outcomes)
+
+    def mocked_get(*args, **kwargs):
+        calls.append(kwargs)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return utils.MockResponseGET(
+            random_timestamp=random_timestamp, http_status=outcome
+        )
+
+    monkeypatch.setattr(requests, 'get', mocked_get)
+    return calls
+
+
+@pytest.fixture
+def sleeps(monkeypatch, homework_module):
+    delays = []
+    monkeypatch.setattr(homework_module.time, 'sleep', delays.append)
+    return delays
+
+
+class TestRetry:
+
+    @pytest.mark.parametrize('failure', [
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        requests.Timeout('timeout'),
+        requests.ConnectionError('connection reset'),
+    ])
+    def test_recoverable_errors_are_retried(self, monkeypatch, sleeps,
+                                            failure, random_timestamp,
+                                            current_timestamp,
+                                            homework_module):
+        calls = mock_responses_get(
+            monkeypatch, [failure, failure, HTTPStatus.OK], random_timestamp
+        )
+        result = homework_module._retry(
+            homework_module.get_api_answer, current_timestamp
+        )
+        assert result['current_date'] == random_timestamp
+        assert len(calls) == 3, (
+            'Убедитесь, что при временной ошибке запрос к API повторяется.'
+        )
+        assert len(sleeps) == 2
+
+    def test_backoff_is_capped_jitter(self, monkeypatch, sleeps,
+                                      random_timestamp, current_timestamp,
+                                      homework_module):
+        failures = [HTTPStatus.INTERNAL_SERVER_ERROR] * 5
+        mock_responses_get(monkeypatch, failures, random_timestamp)
+        with pytest.raises(exceptions.HTTPException):
+            homework_module._retry(
+                homework_module.get_api_answer, current_timestamp,
+                base=1.0, cap=3.0
+            )
+        assert len(sleeps) == 4, (
+            'Убедитесь, что после последней попытки пауза не выполняется.'
+        )
+        for attempt, delay in enumerate(sleeps):
+            assert 0 <= delay <= min(3.0, 2 ** attempt), (
+                'Убедитесь, что пауза между попытками не превышает '
+                'base * 2 ** attempt и cap.'
+            )
+
+    @pytest.mark.parametrize('status', [
+        HTTPStatus.UNAUTHORIZED,
+        HTTPStatus.BAD_REQUEST,
+        HTTPStatus.NOT_FOUND,
+    ])
+    def test_client_errors_fail_fast(self, monkeypatch, sleeps, status,
+                                     random_timestamp, current_timestamp,
+                                     homework_module):
+        calls = mock_responses_get(
+            monkeypatch, [status, HTTPStatus.OK], random_timestamp
+        )
+        with pytest.raises(exceptions.UnrecoverableError):
+            homework_module._retry(
+                homework_module.get_api_answer, current_timestamp
+            )
+        assert len(calls) == 1, (
+            'Убедитесь, что ошибки клиента (4xx) не повторяются.'
+        )
+        assert not sleeps
+
+
+class TestConditionalRequests:
+    ETAG = '"homeworks-v1"'
+    LAST_MODIFIED = 'Wed, 14 Oct 2026 10:00:00 GMT'
+
+    @pytest.fixture(autouse=True)
+    def clean_validators(self, monkeypatch, homework_module):
+        monkeypatch.setattr(homework_module, '_conditional_headers', {})
+        monkeypatch.setattr(homework_module, '_received_validators', {})
+
+    def mock_get(self, monkeypatch, statuses, data):
+        calls = []
+        statuses = list(statuses)
+
+        def mocked_get(*args, **kwargs):
+            calls.append(kwargs)
+            response = utils.MockResponseGET(http_status=statuses.pop(0))
+            response.headers = {
+                'ETag': self.ETAG,
+                'Last-Modified': self.LAST_MODIFIED,
+            }
+            response.json = lambda: data
+            return response
+
+        monkeypatch.setattr(requests, 'get', mocked_get)
+        return calls
+
+    def test_not_modified_after_saved_validators(self, monkeypatch,
+                                                 current_timestamp,
+                                                 homework_module):
+        data = {'homeworks': [], 'current_date': current_timestamp}
+        calls = self.mock_get(
+            monkeypatch, [HTTPStatus.OK, HTTPStatus.NOT_MODIFIED], data
+        )
+        homework_module.get_api_answer(current_timestamp)
+        homework_module._save_validators()
+        result = homework_module.get_api_answer(current_timestamp)
+
+        headers = calls[1]['headers']
+        assert headers['If-None-Match'] == self.ETAG
+        assert headers['If-Modified-Since'] == self.LAST_MODIFIED
+        assert headers['Authorization'].startswith('OAuth ')
+        assert result == {'homeworks': [], 'current_date': current_timestamp}
+
+    def test_validators_not_sent_for_other_timestamp(self, monkeypatch,
+                                                     current_timestamp,
+                                                     homework_module):
+        data = {'homeworks': [], 'current_date': current_timestamp}
+        calls = self.mock_get(monkeypatch, [HTTPStatus.OK] * 2, data)
+        homework_module.get_api_answer(current_timestamp)
+        homework_module._save_validators()
+        homework_module.get_api_answer(current_timestamp + 1)
+        assert 'If-None-Match' not in calls[1]['headers']
+        assert 'If-Modified-Since' not in calls[1]['headers']
+
+    def test_validators_not_saved_when_answer_fails(self, monkeypatch,
+                                                    current_timestamp,
+                                                    homework_module):
+        homework_module.PRACTICUM_TOKEN = 'sometoken'
+        homework_module.TELEGRAM_TOKEN = '1234:abcdefg'
+        homework_module.TELEGRAM_CHAT_ID = '12345'
+        data = {
+            'homeworks': [{'homework_name': 'hw123', 'status': 'unknown'}],
+            'current_date': current_timestamp,
+        }
+        calls = self.mock_get(monkeypatch, [HTTPStatus.OK] * 2, data)
+        monkeypatch.setattr(homework_module, 'send_message', lambda *a: None)
+        monkeypatch.setattr(telegram, 'Bot', utils.MockTelegramBot)
+        polls = []
+
+        def sleep(secs):
+            polls.append(secs)
+            if len(polls) == 2:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(homework_module.time, 'sleep', sleep)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert len(calls) == 2
+        assert 'If-None-Match' not in calls[1]['headers'], (
+            'Убедитесь, что валидаторы ответа сохраняются только после '
+            'успешной обработки ответа API.'
+        )
+
+
+class FloodLimitedBot(utils.MockTelegramBot):
+    """Telegram bot double answering RetryAfter to the first sends."""
+
+    def __init__(self, limited_sends=1, **kwargs):
+        super().__init__(**kwargs)
+        self.limited_sends = limited_sends
+        self.sent = []
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        self.sent.append(text)
+        if len(self.sent) <= self.limited_sends:
+            raise telegram.error.RetryAfter(1)
+        super().send_message(chat_id=chat_id, text=text, **kwargs)
+
+
+class TestSendMessageFloodLimit:
+
+    def test_retry_after_waits_and_resends_once(self, sleeps, caplog,
+                                                random_message,
+                                                homework_module):
+        bot = FloodLimitedBot(limited_sends=1)
+        with utils.check_logging(caplog, level=logging.DEBUG, message=(
+            'Убедитесь, что успешная повторная отправка логируется '
+            'с уровнем `DEBUG`.'
+        )):
+            homework_module.send_message(bot, random_message)
+        assert sleeps == [1], (
+            'Убедитесь, что при RetryAfter бот ждет указанное время один раз.'
+        )
+        assert bot.sent == [random_message, random_message]
+        assert bot.is_message_sent
+
+    def test_second_retry_after_is_logged_as_error(self, sleeps, caplog,
+                                                   random_message,
+                                                   homework_module):
+        bot = FloodLimitedBot(limited_sends=2)
+        with utils.check_logging(caplog, level=logging.ERROR, message=(
+            'Убедитесь, что неудачная повторная отправка логируется '
+            'с уровнем `ERROR`.'
+        )):
+            homework_module.send_message(bot, random_message)
+        assert sleeps == [1]
+        assert len(bot.sent) == 2
+
+
+class TestCheckTokens:
+
+    @pytest.mark.parametrize('missing', [
+        'PRACTICUM_TOKEN', 'TELEGRAM_TOKEN', 'TELEGRAM_CHAT_ID'
+    ])
+    def test_missing_token_is_reported(self, monkeypatch, caplog, missing,
+                                       homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(homework_module, missing, None)
+        with caplog.at_level(logging.CRITICAL):
+            assert homework_module.check_tokens() is False, (
+                'Убедитесь, что `check_tokens` возвращает False, если '
+                'переменная окружения отсутствует.'
+            )
+        critical = [
+            record.getMessage() for record in caplog.records
+            if record.levelno == logging.CRITICAL
+        ]
+        assert len(critical) == 1
+        assert missing in critical[0], (
+            'Убедитесь, что в логе указано имя отсутствующей переменной.'
+        )
+
+    def test_all_tokens_present(self, monkeypatch, homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        assert homework_module.check_tokens() is True
+
+
+class TestCircuitBreaker:
+
+    def run_main(self, monkeypatch, homework_module, api_ok, polls):
+        """Run main() for the given number of polls on a fake clock.
+        api_ok(poll) tells whether the API answers at that poll.
+        Returns the polls with an API call and the sent messages.
+        """
+        homework_module.PRACTICUM_TOKEN = 'sometoken'
+        homework_module.TELEGRAM_TOKEN = '1234:abcdefg'
+        homework_module.TELEGRAM_CHAT_ID = '12345'
+        clock = [0.0]
+        poll = [0]
+        api_calls = []
+        messages = []
+
+        def sleep(secs):
+            clock[0] += secs
+            poll[0] += 1
+            if poll[0] == polls:
+                raise utils.BreakInfiniteLoop('break')
+
+        def get_api_answer(timestamp):
+            api_calls.append(poll[0])
+            if not api_ok(poll[0]):
+                raise exceptions.HTTPException('Страница недоступна')
+            return {'homeworks': [], 'current_date': timestamp}
+
+        monkeypatch.setattr(homework_module.time, 'sleep', sleep)
+        monkeypatch.setattr(homework_module.time, 'monotonic', lambda: clock[0])
+        monkeypatch.setattr(telegram, 'Bot', utils.MockTelegramBot)
+        monkeypatch.setattr(
+            homework_module, '_retry', lambda func, *args: func(*args)
+        )
+        monkeypatch.setattr(homework_module, 'get_api_answer', get_api_answer)
+        monkeypatch.setattr(
+            homework_module, 'send_message',
+            lambda bot, message: messages.append((poll[0], message))
+        )
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        return api_calls, messages
+
+    def paused_message(self, homework_module):
+        return (
+            f'Сбой в работе программы: {homework_module.API_PAUSED_MESSAGE}'
+        )
+
+    def test_breaker_opens_after_threshold(self, monkeypatch,
+                                           homework_module):
+        threshold = homework_module.BREAKER_THRESHOLD
+        api_calls, messages = self.run_main(
+            monkeypatch, homework_module, lambda poll: False, threshold + 1
+        )
+        assert api_calls == list(range(threshold)), (
+            'Убедитесь, что после BREAKER_THRESHOLD неудач подряд '
+            'следующий опрос API пропускается.'
+        )
+        assert messages[-1] == (
+            threshold - 1, self.paused_message(homework_module)
+        )
+
+    def test_failed_probe_doubles_pause(self, monkeypatch, homework_module):
+        threshold = homework_module.BREAKER_THRESHOLD
+        api_calls, messages = self.run_main(
+            monkeypatch, homework_module, lambda poll: False, threshold + 8
+        )
+        first_probe = threshold + 1
+        second_probe = first_probe + 4
+        assert api_calls == (
+            list(range(threshold)) + [first_probe, second_probe]
+        ), 'Убедитесь, что после неудачной пробы пауза удваивается.'
+        paused = [
+            poll for poll, message in messages
+            if message == self.paused_message(homework_module)
+        ]
+        assert len(paused) == 1, (
+            'Убедитесь, что о недоступности API сообщается один раз.'
+        )
+
+    def test_successful_probe_resets_breaker(self, monkeypatch,
+                                             homework_module):
+        threshold = homework_module.BREAKER_THRESHOLD
+        probe = threshold + 1
+        api_calls, messages = self.run_main(
+            monkeypatch, homework_module,
+            lambda poll: probe <= poll < probe + 2, probe + 2 + threshold + 1
+        )
+        recovered = list(range(probe, probe + 2 + threshold))
+        assert api_calls == list(range(threshold)) + recovered, (
+            'Убедитесь, что после успешной пробы счетчик неудач '
+            'сбрасывается и опрос идет по расписанию.'
+        )
+        assert (probe, 'Нет новых статусов') in messages
@@ -79,6 +79,7 @@ class MockResponseGET:
                  **kwargs):
         self.random_timestamp = random_timestamp
         self.status_code = http_status
+        self.headers = {}
         self.reason = ''
         self.text = ''
         logging.warn(MockResponseGET.CALLED_LOG_MSG)